@@ -23,7 +23,12 @@ callbacks and keymaps properly.
 
 import bpy
 import math
+import numpy as np
+from collections import defaultdict
+from functools import lru_cache
 from math import radians, degrees
+from mathutils import Matrix, Vector
+from bpy.app.handlers import persistent
 from bpy.props import (
     EnumProperty,
     FloatProperty,
@@ -52,6 +57,32 @@ bl_info = {
 }
 
 
+# -----------------------------------------------------------------------------
+# Module-level constants and cached operator references
+# -----------------------------------------------------------------------------
+
+_HALF_PI = math.pi * 0.5
+
+# Axis name to Euler/Vector component index
+_AXIS_IDX = {'X': 0, 'Y': 1, 'Z': 2}
+
+# Preset cursor orientations as Euler angles (radians)
+_PRESETS = {
+    'FRONT': (0.0, 0.0, 0.0),
+    'RIGHT': (0.0, 0.0, -_HALF_PI),
+    'TOP': (_HALF_PI, 0.0, 0.0),
+    'BACK': (0.0, 0.0, math.pi),
+    'LEFT': (0.0, 0.0, _HALF_PI),
+    'BOTTOM': (-_HALF_PI, 0.0, 0.0),
+}
+
+# Bound once at import so hot operators skip the bpy.ops attribute chain
+_snap_selected_to_cursor = bpy.ops.view3d.snap_selected_to_cursor
+_snap_cursor_to_selected = bpy.ops.view3d.snap_cursor_to_selected
+_origin_set = bpy.ops.object.origin_set
+_create_orientation = bpy.ops.transform.create_orientation
+
+
 # -----------------------------------------------------------------------------
 # Property Group to store settings on the scene
 # -----------------------------------------------------------------------------
@@ -116,8 +147,16 @@ def get_step(scene):
 # Machine Tools Integration Detection
 # -----------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def is_machine_tools_available():
-    """Check if Machine Tools (MACHIN3tools) is installed and enabled."""
+    """Check if Machine Tools (MACHIN3tools) is installed and enabled.
+
+    The result is cached because this is queried from draw and description
+    callbacks; call ``_invalidate_mt_cache()`` when add-on state may change.
+    The cache is cleared on register/unregister, on file load and whenever
+    this add-on's preferences are drawn.  Toggling MACHIN3tools elsewhere in
+    Preferences is not seen by the sidebar panel until one of those happens.
+    """
     try:
         import addon_utils
         for mod in addon_utils.modules():
@@ -136,6 +175,29 @@ def get_machine_tools_cursor_pie():
     except:
         return None
 
+def _invalidate_mt_cache():
+    """Forget cached Machine Tools detection results."""
+    is_machine_tools_available.cache_clear()
+
+@persistent
+def _invalidate_mt_cache_on_load(_dummy):
+    """load_post handler: re-probe Machine Tools after a file (or startup) load."""
+    _invalidate_mt_cache()
+
+# Rows of (idname, text, icon, props) buttons added to the Machine Tools
+# cursor pie, drawn with draw_operator_buttons()
+_PIE_ROWS = (
+    # First row - Reset and View alignment
+    (("cursor.reset_orientation", "Reset", 'LOOP_BACK', {}),
+     ("cursor.align_to_view", "to View", 'VIEW_ORTHO', {})),
+    # Second row - Preset and Surface alignment
+    (("cursor.set_preset_orientation", "Preset", 'ORIENTATION_CURSOR', {}),
+     ("cursor.align_to_surface", "Surface", 'UV_FACESEL', {})),
+    # Third row - Copy and Apply tools
+    (("cursor.copy_from_object", "Copy", 'COPYDOWN', {}),
+     ("cursor.apply_to_object", "Apply", 'CHECKMARK', {})),
+)
+
 def integrate_with_machine_tools_cursor_pie():
     """Integrate our operators directly into Machine Tools cursor pie menu."""
     try:
@@ -172,20 +234,9 @@ def integrate_with_machine_tools_cursor_pie():
                 col.scale_x = 1.2
                 col.scale_y = 1.1
                 
-                # First row - Reset and View alignment
-                row = col.row(align=True)
-                row.operator("cursor.reset_orientation", text="Reset", icon='LOOP_BACK')
-                row.operator("cursor.align_to_view", text="to View", icon='VIEW_ORTHO')
-                
-                # Second row - Preset and Surface alignment
-                row = col.row(align=True)
-                row.operator("cursor.set_preset_orientation", text="Preset", icon='ORIENTATION_CURSOR')
-                row.operator("cursor.align_to_surface", text="Surface", icon='UV_FACESEL')
-                
-                # Third row - Copy and Apply tools
-                row = col.row(align=True)
-                row.operator("cursor.copy_from_object", text="Copy", icon='COPYDOWN')
-                row.operator("cursor.apply_to_object", text="Apply", icon='CHECKMARK')
+                # Button rows - Reset/View, Preset/Surface, Copy/Apply
+                for row in _PIE_ROWS:
+                    draw_operator_buttons(col.row(align=True), row)
                 
                 # Now call Machine Tools draw method to create their pie menu
                 # This will fill the remaining slots (LEFT, RIGHT, BOTTOM, etc.)
@@ -204,15 +255,20 @@ def integrate_with_machine_tools_cursor_pie():
 
 def remove_machine_tools_integration():
     """Clean up Machine Tools integration by restoring original draw method."""
+    cursor_pie_class = getattr(bpy.types, 'MACHIN3_MT_cursor_pie', None)
+    if cursor_pie_class is None:
+        return
+    original_draw = getattr(cursor_pie_class, '_original_draw_cursor_align', None)
+    if original_draw is None:
+        return
+    
+    # Restore original draw method
+    cursor_pie_class.draw = original_draw
     try:
-        cursor_pie_class = getattr(bpy.types, 'MACHIN3_MT_cursor_pie', None)
-        if cursor_pie_class and hasattr(cursor_pie_class, '_original_draw_cursor_align'):
-            # Restore original draw method
-            cursor_pie_class.draw = cursor_pie_class._original_draw_cursor_align
-            delattr(cursor_pie_class, '_original_draw_cursor_align')
-            print("Cursor & Origin Alignment: Restored Machine Tools cursor pie menu")
-    except Exception as e:
-        print(f"Failed to remove Machine Tools integration: {e}")
+        delattr(cursor_pie_class, '_original_draw_cursor_align')
+    except AttributeError:
+        pass
+    print("Cursor & Origin Alignment: Restored Machine Tools cursor pie menu")
 
 
 # -----------------------------------------------------------------------------
@@ -222,6 +278,10 @@ def remove_machine_tools_integration():
 def rotate_euler(euler, axis, delta):
     """Return a copy of the Euler with the specified axis rotated by delta radians.
 
+    The rotated axis is wrapped back into [-pi, pi] only once it leaves
+    [-2pi, 2pi]; angles in between describe the same orientation and are
+    handled correctly by Blender.
+
     Parameters:
         euler (Euler): Euler angles to start from.
         axis (str): 'X', 'Y' or 'Z'.
@@ -230,14 +290,11 @@ def rotate_euler(euler, axis, delta):
         Euler: a new Euler instance with the rotation applied.
     """
     new_eul = euler.copy()
-    axis = axis.upper()
-    if axis == 'X':
-        new_eul.x += delta
-    elif axis == 'Y':
-        new_eul.y += delta
-    elif axis == 'Z':
-        new_eul.z += delta
-    return new_eul.normalized()  # keep values within [-pi, pi]
+    idx = _AXIS_IDX[axis.upper()]
+    new_eul[idx] += delta
+    if abs(new_eul[idx]) > math.tau:
+        new_eul[idx] = math.remainder(new_eul[idx], math.tau)  # wrap into [-pi, pi]
+    return new_eul
 
 
 def copy_object_rotation_to_cursor(obj, cursor):
@@ -247,21 +304,67 @@ def copy_object_rotation_to_cursor(obj, cursor):
     cursor.rotation_euler = matrix.to_euler(cursor.rotation_mode)
 
 
-def apply_cursor_rotation_to_object(cursor, obj):
-    """Set an object's world rotation to match the cursor's orientation."""
-    # Build rotation matrix from cursor and assign to object's matrix_world
+def apply_cursor_rotation_to_object(cursor, obj, rotation=None):
+    """Set an object's world rotation to match the cursor's orientation.
+
+    ``rotation`` may be passed in (e.g. a quaternion computed once) when the
+    same cursor rotation is applied to many objects.
+    """
+    if rotation is None:
+        # cursor.matrix reflects the cursor whatever its rotation mode
+        rotation = cursor.matrix.to_quaternion()
     # Keep translation and scale components
-    cur_rot = cursor.rotation_euler.to_matrix()
-    obj_mat = obj.matrix_world
-    scale = obj_mat.to_scale()
-    loc = obj_mat.to_translation()
-    new_mat = cur_rot.to_4x4()
-    # apply scale
-    new_mat[0][0] *= scale.x
-    new_mat[1][1] *= scale.y
-    new_mat[2][2] *= scale.z
-    new_mat.translation = loc
-    obj.matrix_world = new_mat
+    loc, _rot, scale = obj.matrix_world.decompose()
+    obj.matrix_world = Matrix.LocRotScale(loc, rotation, scale)
+
+
+def can_shift_origin_directly(obj):
+    """Return True if the object's origin can be moved by editing its mesh data.
+
+    Shared meshes, shape keys, children and constraints all need the extra
+    bookkeeping that ``bpy.ops.object.origin_set`` performs, so those objects
+    are excluded.
+    Linked or overridden data is read-only here, and a matrix that can't be
+    inverted (e.g. zero scale) has no local offset, so both are excluded too.
+    """
+    data = obj.data
+    return (
+        obj.type == 'MESH'
+        and obj.library is None
+        and obj.override_library is None
+        and data.library is None
+        and data.override_library is None
+        and data.users == 1
+        and data.shape_keys is None
+        and not data.is_editmode
+        and not obj.children
+        and not obj.constraints
+        and abs(obj.matrix_world.determinant()) > 1e-12
+    )
+
+
+def shift_mesh_origin(obj, location):
+    """Move a mesh object's origin to a world-space location.
+
+    The vertices are offset in bulk so the geometry stays where it is in world
+    space, then only the object's location is moved onto the new origin, so
+    its rotation and scale values are left untouched.
+    """
+    me = obj.data
+    mat = obj.matrix_world
+    offset = mat.inverted() @ location
+    world_delta = location - mat.translation
+
+    coords = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get('co', coords)
+    coords.reshape(-1, 3)[:] -= np.asarray(offset, dtype=np.float32)
+    me.vertices.foreach_set('co', coords)
+    me.update()
+
+    # Map the world-space move into the space obj.location lives in; without
+    # constraints, matrix_world is that space's matrix times matrix_basis
+    parent_space = mat @ obj.matrix_basis.inverted()
+    obj.location += parent_space.to_3x3().inverted() @ world_delta
 
 
 # -----------------------------------------------------------------------------
@@ -323,12 +426,8 @@ class CURSOR_OT_flip_axis(Operator):
     def execute(self, context):
         cursor = context.scene.cursor
         eul = cursor.rotation_euler.copy()
-        if self.axis == 'X':
-            eul.x = -eul.x
-        elif self.axis == 'Y':
-            eul.y = -eul.y
-        elif self.axis == 'Z':
-            eul.z = -eul.z
+        idx = _AXIS_IDX[self.axis]
+        eul[idx] = -eul[idx]
         cursor.rotation_euler = eul
         return {'FINISHED'}
 
@@ -360,8 +459,10 @@ class CURSOR_OT_apply_to_object(Operator):
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
         cursor = context.scene.cursor
+        # cursor.matrix reflects the cursor whatever its rotation mode
+        cur_quat = cursor.matrix.to_quaternion()
         for obj in selected:
-            apply_cursor_rotation_to_object(cursor, obj)
+            apply_cursor_rotation_to_object(cursor, obj, cur_quat)
         return {'FINISHED'}
 
 
@@ -372,32 +473,27 @@ class CURSOR_OT_align_to_view(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        # Get the active 3D view's rotation
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        # Get view rotation from region data
-                        for region in area.regions:
-                            if region.type == 'WINDOW':
-                                try:
-                                    view_rotation = region.data.view_rotation
-                                    # Convert quaternion to euler
-                                    cursor = context.scene.cursor
-                                    cursor.rotation_euler = view_rotation.to_euler(cursor.rotation_mode)
-                                    return {'FINISHED'}
-                                except AttributeError:
-                                    # Fallback: try to get view matrix
-                                    try:
-                                        view_matrix = region.data.view_matrix
-                                        view_rot = view_matrix.to_3x3().to_euler()
-                                        cursor = context.scene.cursor
-                                        cursor.rotation_euler = view_rot
-                                        return {'FINISHED'}
-                                    except AttributeError:
-                                        continue
-        self.report({'WARNING'}, "Could not determine view orientation")
-        return {'CANCELLED'}
+        cursor = context.scene.cursor
+
+        # Invoked from a 3D view, the region data is already in the context
+        rd = getattr(context, 'region_data', None)
+        if rd is not None and hasattr(rd, 'view_rotation'):
+            cursor.rotation_euler = rd.view_rotation.to_euler(cursor.rotation_mode)
+            return {'FINISHED'}
+
+        # Otherwise fall back to the first 3D view's main region on screen;
+        # next() stops the whole search at the first match
+        region = next(
+            (r for a in context.screen.areas if a.type == 'VIEW_3D'
+             for r in a.regions if r.type == 'WINDOW' and getattr(r, 'data', None)),
+            None,
+        )
+        if region is None:
+            self.report({'WARNING'}, "Could not determine view orientation")
+            return {'CANCELLED'}
+
+        cursor.rotation_euler = region.data.view_rotation.to_euler(cursor.rotation_mode)
+        return {'FINISHED'}
 
 
 class CURSOR_OT_align_to_surface(Operator):
@@ -411,31 +507,31 @@ class CURSOR_OT_align_to_surface(Operator):
             self.report({'WARNING'}, "Must be in Edit Mode with faces selected")
             return {'CANCELLED'}
         
-        # Get selected faces and calculate average normal
-        import bmesh
+        # Flush edit-mode changes so the mesh data reflects the current
+        # selection; no bmesh is built, the face arrays are read directly
         obj = context.edit_object
-        bm = bmesh.from_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
-        
-        selected_faces = [f for f in bm.faces if f.select]
-        if not selected_faces:
+        obj.update_from_editmode()
+        me = obj.data
+        face_count = len(me.polygons)
+
+        # Read all face normals and selection flags in bulk
+        normals = np.empty(face_count * 3, dtype=np.float32)
+        me.polygons.foreach_get('normal', normals)
+        normals = normals.reshape(-1, 3)
+        selected = np.empty(face_count, dtype=bool)
+        me.polygons.foreach_get('select', selected)
+
+        if not selected.any():
             self.report({'WARNING'}, "No faces selected")
             return {'CANCELLED'}
-        
-        # Calculate average normal
-        avg_normal = (0, 0, 0)
-        for face in selected_faces:
-            avg_normal = (avg_normal[0] + face.normal.x,
-                         avg_normal[1] + face.normal.y,
-                         avg_normal[2] + face.normal.z)
-        
-        # Normalize
-        length = (avg_normal[0]**2 + avg_normal[1]**2 + avg_normal[2]**2)**0.5
+
+        # Calculate average normal and normalize
+        avg_normal = normals[selected].sum(axis=0)
+        length = float(np.linalg.norm(avg_normal))
         if length > 0:
-            avg_normal = (avg_normal[0]/length, avg_normal[1]/length, avg_normal[2]/length)
+            avg_normal = avg_normal / length
             
             # Convert normal to rotation matrix and then to euler
-            from mathutils import Vector, Matrix
             normal_vec = Vector(avg_normal)
             up_vec = Vector((0, 0, 1))
             
@@ -476,21 +572,7 @@ class CURSOR_OT_set_preset_orientation(Operator):
 
     def execute(self, context):
         cursor = context.scene.cursor
-        
-        # Set rotation based on preset
-        if self.orientation == 'FRONT':
-            cursor.rotation_euler = (0, 0, 0)
-        elif self.orientation == 'RIGHT':
-            cursor.rotation_euler = (0, 0, -1.570796)  # -90 degrees
-        elif self.orientation == 'TOP':
-            cursor.rotation_euler = (1.570796, 0, 0)   # 90 degrees
-        elif self.orientation == 'BACK':
-            cursor.rotation_euler = (0, 0, 3.141593)   # 180 degrees
-        elif self.orientation == 'LEFT':
-            cursor.rotation_euler = (0, 0, 1.570796)   # 90 degrees
-        elif self.orientation == 'BOTTOM':
-            cursor.rotation_euler = (-1.570796, 0, 0)  # -90 degrees
-        
+        cursor.rotation_euler = _PRESETS[self.orientation]
         return {'FINISHED'}
 
 
@@ -501,23 +583,14 @@ class CURSOR_OT_set_to_selection_center(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        if not context.selected_objects:
+        selected = context.selected_objects
+        if not selected:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
         
         # Calculate center of all selected objects
-        center = (0, 0, 0)
-        count = 0
-        
-        for obj in context.selected_objects:
-            center = (center[0] + obj.location.x,
-                     center[1] + obj.location.y,
-                     center[2] + obj.location.z)
-            count += 1
-        
-        if count > 0:
-            center = (center[0] / count, center[1] / count, center[2] / count)
-            context.scene.cursor.location = center
+        center = sum((obj.location for obj in selected), Vector())
+        context.scene.cursor.location = center / len(selected)
         
         return {'FINISHED'}
 
@@ -551,15 +624,29 @@ class OBJECT_OT_origin_to_cursor(Operator):
         return "Move selected objects' origins to the 3D cursor position"
 
     def execute(self, context):
-        if not context.selected_objects:
-            self.report({'WARNING'}, "No objects selected")
+        # Like origin_set, only touch objects that can actually be edited
+        selected = context.selected_editable_objects
+        if not selected:
+            self.report({'WARNING'}, "No editable objects selected")
             return {'CANCELLED'}
         
         # Check if Machine Tools is available and suggest using their operator
         if is_machine_tools_available():
             self.report({'INFO'}, "Consider using Machine Tools 'machin3.origin_to_cursor' for advanced options")
         
-        bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
+        cursor_loc = context.scene.cursor.location
+        object_mode = context.mode == 'OBJECT'
+        fallback = []
+        for obj in selected:
+            if not (object_mode and can_shift_origin_directly(obj)):
+                fallback.append(obj)
+                continue
+            shift_mesh_origin(obj, cursor_loc)
+
+        # Anything the direct path can't handle safely goes through the operator
+        if fallback:
+            with context.temp_override(selected_editable_objects=fallback):
+                _origin_set(type='ORIGIN_CURSOR')
         return {'FINISHED'}
 
 
@@ -583,21 +670,24 @@ class OBJECT_OT_rotate_axis(Operator):
     )
 
     def execute(self, context):
-        if not context.selected_objects:
+        selected = context.selected_objects
+        if not selected:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
         step_rad = get_step(context.scene)
         delta = step_rad if self.direction == 'POS' else -step_rad
-        for obj in context.selected_objects:
-            eul = obj.rotation_euler.copy()
-            axis = self.axis
-            if axis == 'X':
-                eul.x += delta
-            elif axis == 'Y':
-                eul.y += delta
-            elif axis == 'Z':
-                eul.z += delta
-            obj.rotation_euler = eul
+        n = len(selected)
+        axis_idx = _AXIS_IDX[self.axis]
+        # Gather all rotations into one (N, 3) array and offset the chosen
+        # axis in a single vectorized add instead of per-object Euler math
+        rotations = np.fromiter(
+            (c for obj in selected for c in obj.rotation_euler),
+            dtype=np.float64,
+            count=n * 3,
+        ).reshape(n, 3)
+        rotations[:, axis_idx] += delta
+        for obj, rot in zip(selected, rotations.tolist()):
+            obj.rotation_euler = rot
         return {'FINISHED'}
 
 
@@ -608,10 +698,11 @@ class OBJECT_OT_reset_orientation(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        if not context.selected_objects:
+        selected = context.selected_objects
+        if not selected:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
-        for obj in context.selected_objects:
+        for obj in selected:
             obj.rotation_euler = (0.0, 0.0, 0.0)
         return {'FINISHED'}
 
@@ -640,7 +731,7 @@ class OBJECT_OT_align_to_cursor(Operator):
         # Snap selection to cursor; when move_objects=False use_offset stays True
         use_offset = not self.move_objects
         # Use rotation only if requested
-        bpy.ops.view3d.snap_selected_to_cursor(
+        _snap_selected_to_cursor(
             use_offset=use_offset,
             use_rotation=self.use_rotation
         )
@@ -657,7 +748,7 @@ class OBJECT_OT_snap_cursor_to_selected(Operator):
         if not context.selected_objects and context.mode != 'EDIT_MESH':
             self.report({'WARNING'}, "Nothing selected")
             return {'CANCELLED'}
-        bpy.ops.view3d.snap_cursor_to_selected()
+        _snap_cursor_to_selected()
         return {'FINISHED'}
 
 
@@ -677,7 +768,7 @@ class OBJECT_OT_snap_selected_to_cursor(Operator):
         if not context.selected_objects:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
-        bpy.ops.view3d.snap_selected_to_cursor(use_offset=self.use_offset, use_rotation=False)
+        _snap_selected_to_cursor(use_offset=self.use_offset, use_rotation=False)
         return {'FINISHED'}
 
 
@@ -697,10 +788,10 @@ class OBJECT_OT_create_transform_orientation(Operator):
         cursor = context.scene.cursor
         
         # Create a new transform orientation
-        bpy.ops.transform.create_orientation(name=self.name, use_view=False)
+        _create_orientation(name=self.name, use_view=False)
         
         # Get the newly created orientation
-        for orientation in bpy.context.scene.transform_orientation_slots:
+        for orientation in context.scene.transform_orientation_slots:
             if orientation.name == self.name:
                 # Set the orientation to match cursor rotation
                 orientation.matrix = cursor.matrix
@@ -722,35 +813,22 @@ class OBJECT_OT_align_objects_to_each_other(Operator):
 
     def execute(self, context):
         active = context.active_object
-        selected = [obj for obj in context.selected_objects if obj != active]
-        
         if not active:
             self.report({'WARNING'}, "No active object")
             return {'CANCELLED'}
         
+        selected = [obj for obj in context.selected_objects if obj is not active]
         if not selected:
             self.report({'WARNING'}, "No other objects selected")
             return {'CANCELLED'}
         
-        # Get active object's world rotation
-        active_rot = active.matrix_world.to_euler()
+        # Get active object's world rotation once, outside the loop
+        active_quat = active.matrix_world.to_3x3().normalized().to_quaternion()
         
-        # Apply to all selected objects
+        # Apply to all selected objects, keeping world position and scale
         for obj in selected:
-            # Keep current world position and scale
-            world_pos = obj.matrix_world.to_translation()
-            world_scale = obj.matrix_world.to_scale()
-            
-            # Create new matrix with active's rotation
-            new_matrix = active_rot.to_matrix_4x4()
-            new_matrix.translation = world_pos
-            
-            # Apply scale
-            new_matrix[0][0] *= world_scale.x
-            new_matrix[1][1] *= world_scale.y
-            new_matrix[2][2] *= world_scale.z
-            
-            obj.matrix_world = new_matrix
+            loc, _rot, scale = obj.matrix_world.decompose()
+            obj.matrix_world = Matrix.LocRotScale(loc, active_quat, scale)
         
         return {'FINISHED'}
 
@@ -780,37 +858,46 @@ class OBJECT_OT_distribute_along_cursor(Operator):
     )
 
     def execute(self, context):
-        if len(context.selected_objects) < 2:
+        selected = context.selected_objects
+        if len(selected) < 2:
             self.report({'WARNING'}, "Select at least 2 objects")
             return {'CANCELLED'}
         
         cursor = context.scene.cursor
-        cursor_matrix = cursor.matrix
+        cursor_matrix = cursor.matrix.to_3x3()
         
         # Sort objects by distance from cursor along the specified axis
-        objects = list(context.selected_objects)
-        axis_idx = {'X': 0, 'Y': 1, 'Z': 2}[self.axis]
+        axis_idx = _AXIS_IDX[self.axis]
+        
+        # The cursor's local axis in world space is a column of its matrix
+        cursor_loc = np.array(cursor.location, dtype=np.float64)
+        axis_vec = np.array(cursor_matrix.col[axis_idx], dtype=np.float64)
+        if axis_vec @ axis_vec < 1e-12:
+            self.report({'WARNING'}, "Cursor axis is degenerate")
+            return {'CANCELLED'}
         
-        # Calculate positions along the cursor's axis
-        positions = []
-        for obj in objects:
-            # Get object position relative to cursor
-            rel_pos = obj.matrix_world.to_translation() - cursor.location
-            # Project onto cursor's axis
-            axis_pos = rel_pos.dot(cursor_matrix[axis_idx][:3])
-            positions.append((axis_pos, obj))
+        # Project all object positions onto the axis in one go
+        n = len(selected)
+        positions = np.fromiter(
+            (c for obj in selected for c in obj.matrix_world.translation),
+            dtype=np.float64,
+            count=n * 3,
+        ).reshape(n, 3)
+        proj = (positions - cursor_loc) @ axis_vec
         
         # Sort by position along axis
-        positions.sort(key=lambda x: x[0])
+        order = np.argsort(proj, kind='stable')
         
-        # Distribute objects
-        for i, (_, obj) in enumerate(positions):
-            # Calculate new position
-            offset = i * self.spacing
-            new_pos = cursor.location + cursor_matrix[axis_idx][:3] * offset
-            
-            # Update object position
-            obj.location = new_pos
+        # Compute all target positions at once and scatter them back into
+        # selection order, so row i belongs to selected[i]
+        offsets = np.arange(n, dtype=np.float64) * self.spacing
+        new_locs = np.empty_like(positions)
+        new_locs[order] = cursor_loc + axis_vec * offsets[:, None]
+        
+        # Distribute objects; tolist() converts every row to plain floats in
+        # one pass instead of boxing NumPy scalars on each assignment
+        for obj, loc in zip(selected, new_locs.tolist()):
+            obj.location = loc
         
         return {'FINISHED'}
 
@@ -826,18 +913,156 @@ class OBJECT_OT_copy_cursor_location(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        if not context.selected_objects:
+        selected = context.selected_objects
+        if not selected:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
         
-        cursor_location = context.scene.cursor.location
+        # Snapshot once; the location setter copies the values into each object
+        cursor_location = tuple(context.scene.cursor.location)
         
-        for obj in context.selected_objects:
-            obj.location = cursor_location.copy()
+        for obj in selected:
+            obj.location = cursor_location
         
         return {'FINISHED'}
 
 
+# -----------------------------------------------------------------------------
+# UI layout tables
+# -----------------------------------------------------------------------------
+
+# Rotation buttons as rows of (text, axis, direction)
+_ROTATE_ROWS = (
+    (("+X", 'X', 'POS'), ("-X", 'X', 'NEG')),
+    (("+Y", 'Y', 'POS'), ("-Y", 'Y', 'NEG')),
+    (("+Z", 'Z', 'POS'), ("-Z", 'Z', 'NEG')),
+)
+
+# Operator buttons as (idname, text, icon, props); a text of None keeps the
+# operator's own label
+_PANEL_CURSOR_BUTTONS = (
+    ("cursor.flip_axis", "Flip X", 'NONE', {'axis': 'X'}),
+    ("cursor.flip_axis", "Flip Y", 'NONE', {'axis': 'Y'}),
+    ("cursor.flip_axis", "Flip Z", 'NONE', {'axis': 'Z'}),
+    ("cursor.copy_from_object", None, 'COPYDOWN', {}),
+    ("cursor.apply_to_object", None, 'CHECKMARK', {}),
+    ("cursor.align_to_view", "Align to View", 'VIEW_ORTHO', {}),
+    ("cursor.align_to_surface", "Align to Surface", 'UV_FACESEL', {}),
+    ("cursor.set_preset_orientation", "Set Preset Orientation", 'ORIENTATION_CURSOR', {}),
+    ("cursor.set_to_selection_center", "Cursor to Selection Center", 'PIVOT_CURSOR', {}),
+    ("cursor.set_to_view_center", "Cursor to View Center", 'PIVOT_CURSOR', {}),
+    ("object.create_transform_orientation", "Create Transform Orientation", 'ORIENTATION_GLOBAL', {}),
+)
+
+_PANEL_SNAP_ROW = (
+    ("object.cursor_to_selected", "Cursor to Sel", 'PIVOT_CURSOR', {}),
+    ("object.selected_to_cursor", "Sel to Cursor", 'PIVOT_CURSOR', {}),
+)
+
+_PANEL_ORIGIN_ROW = (
+    ("object.origin_to_cursor", "Origin to Cursor", 'PIVOT_CURSOR', {}),
+    ("object.copy_cursor_location", "Copy Cursor Loc", 'COPYDOWN', {}),
+    ("object.reset_orientation", "Reset Rot", 'OBJECT_ORIGIN', {}),
+)
+
+_PANEL_OBJECT_BUTTONS = (
+    ("object.align_to_cursor", "Align to Cursor", 'PIVOT_CURSOR', {}),
+    ("object.align_objects_to_each_other", "Align to Active", 'CONSTRAINT', {}),
+    ("object.distribute_along_cursor", "Distribute Along Cursor", 'ARROW_LEFTRIGHT', {}),
+)
+
+_SNAP_MENU_ALIGN_BUTTONS = (
+    # Cursor orientation tools - integrate with existing "to" pattern
+    ("cursor.reset_orientation", "Cursor to World Orientation", 'LOOP_BACK', {}),
+    ("cursor.align_to_view", "Cursor to View Orientation", 'VIEW_ORTHO', {}),
+    ("cursor.align_to_surface", "Cursor to Surface Normal", 'UV_FACESEL', {}),
+    ("cursor.set_preset_orientation", "Cursor to Preset", 'ORIENTATION_CURSOR', {}),
+    # Cursor positioning tools - following the "to" naming convention
+    ("cursor.set_to_selection_center", "Cursor to Selection Center", 'PIVOT_CURSOR', {}),
+    ("cursor.set_to_view_center", "Cursor to View Center", 'PIVOT_CURSOR', {}),
+    # Object alignment tools - integrate with existing object tools
+    ("object.origin_to_cursor", "Origin to Cursor", 'PIVOT_CURSOR', {}),
+    ("object.copy_cursor_location", "Object to Cursor Location", 'COPYDOWN', {}),
+    # Advanced alignment tools
+    ("object.align_to_cursor", "Objects to Cursor Orientation", 'PIVOT_CURSOR',
+     {'move_objects': True, 'use_rotation': True}),
+    ("object.align_objects_to_each_other", "Objects to Active Orientation", 'CONSTRAINT', {}),
+)
+
+_SNAP_MENU_UTILITY_BUTTONS = (
+    ("cursor.copy_from_object", "Cursor to Object Rotation", 'COPYDOWN', {}),
+    ("cursor.apply_to_object", "Apply Cursor to Objects", 'CHECKMARK', {}),
+    ("object.create_transform_orientation", "Create Transform Orientation", 'ORIENTATION_GLOBAL', {}),
+    ("object.distribute_along_cursor", "Distribute Along Cursor", 'ARROW_LEFTRIGHT', {}),
+)
+
+_PIE_WHEEL_BUTTONS = (
+    # Top (8 o'clock position) – Cursor to Selected
+    ("object.cursor_to_selected", "Cursor to Selected", 'PIVOT_CURSOR', {}),
+    # Right – Selected to Cursor (no offset)
+    ("object.selected_to_cursor", "Selected to Cursor", 'PIVOT_CURSOR', {'use_offset': False}),
+    # Bottom – Origin to Cursor
+    ("object.origin_to_cursor", "Origin to Cursor", 'OBJECT_ORIGIN', {}),
+    # Left – Align to Cursor (with rotation)
+    ("object.align_to_cursor", "Align to Cursor", 'PIVOT_CURSOR',
+     {'move_objects': True, 'use_rotation': True}),
+    # Upper left – Reset Cursor
+    ("cursor.reset_orientation", "Reset Cursor", 'LOOP_BACK', {}),
+    # Upper right – Reset Objects
+    ("object.reset_orientation", "Reset Objects", 'OBJECT_ORIGIN', {}),
+    # Lower right – Rotate Cursor +Z
+    ("cursor.rotate_axis", "Rotate Cursor +Z", 'DRIVER_ROTATIONAL_DIFFERENCE',
+     {'axis': 'Z', 'direction': 'POS'}),
+    # Lower left – Rotate Objects +Z
+    ("object.rotate_axis_step", "Rotate Objects +Z", 'DRIVER_ROTATIONAL_DIFFERENCE',
+     {'axis': 'Z', 'direction': 'POS'}),
+)
+
+_PIE_WHEEL_STANDALONE_BUTTONS = (
+    ("cursor.align_to_view", "Align to View", 'VIEW_ORTHO', {}),
+    ("cursor.align_to_surface", "Align to Surface", 'UV_FACESEL', {}),
+)
+
+_MT_MENU_ORIENTATION_BUTTONS = (
+    ("cursor.reset_orientation", None, 'LOOP_BACK', {}),
+    ("cursor.align_to_view", None, 'VIEW_ORTHO', {}),
+    ("cursor.align_to_surface", None, 'UV_FACESEL', {}),
+    ("cursor.set_preset_orientation", None, 'ORIENTATION_CURSOR', {}),
+)
+
+_MT_MENU_POSITION_BUTTONS = (
+    ("cursor.set_to_selection_center", None, 'PIVOT_CURSOR', {}),
+    ("cursor.set_to_view_center", None, 'PIVOT_CURSOR', {}),
+)
+
+
+def draw_operator_buttons(layout, buttons):
+    """Add a static table of (idname, text, icon, props) buttons to a layout."""
+    for idname, text, icon, props in buttons:
+        if text is None:
+            op = layout.operator(idname, icon=icon)
+        else:
+            op = layout.operator(idname, text=text, icon=icon)
+        for key, value in props.items():
+            setattr(op, key, value)
+
+
+def _op_rot(layout, text, axis, direction, op_id="cursor.rotate_axis"):
+    """Add a rotate button with both axis and direction bound on one operator."""
+    op = layout.operator(op_id, text=text)
+    op.axis = axis
+    op.direction = direction
+    return op
+
+
+def draw_rotate_rows(layout, idname):
+    """Add one aligned row of +/- rotation buttons per axis."""
+    for pair in _ROTATE_ROWS:
+        row = layout.row(align=True)
+        for text, axis, direction in pair:
+            _op_rot(row, text, axis, direction, idname)
+
+
 # -----------------------------------------------------------------------------
 # Panel Class
 # -----------------------------------------------------------------------------
@@ -862,7 +1087,7 @@ class VIEW3D_PT_cursor_align(Panel):
             row = box.row()
             row.scale_y = 1.2
             row.operator("cursor.machine_tools_menu", text="Quick Access Menu", icon='MENU_PANEL')
-            box.label(text="Add 'cursor.machine_tools_menu' to Quick Favorites", icon='INFO')
+            box.label(text="Add 'cursor.machine_tools_menu' to Quick Favorites", icon='INFO', translate=False)
 
         # Display current cursor rotation
         box = layout.box()
@@ -870,29 +1095,8 @@ class VIEW3D_PT_cursor_align(Panel):
         col = box.column(align=True)
         col.prop(cursor, "rotation_euler", text="Euler")
         col.operator("cursor.reset_orientation", icon='LOOP_BACK')
-        row = col.row(align=True)
-        row.operator("cursor.rotate_axis", text="+X").axis = 'X'
-        row.operator("cursor.rotate_axis", text="-X").axis = 'X'
-        row.operator("cursor.rotate_axis", text="-X").direction = 'NEG'
-        row = col.row(align=True)
-        row.operator("cursor.rotate_axis", text="+Y").axis = 'Y'
-        row.operator("cursor.rotate_axis", text="-Y").axis = 'Y'
-        row.operator("cursor.rotate_axis", text="-Y").direction = 'NEG'
-        row = col.row(align=True)
-        row.operator("cursor.rotate_axis", text="+Z").axis = 'Z'
-        row.operator("cursor.rotate_axis", text="-Z").axis = 'Z'
-        row.operator("cursor.rotate_axis", text="-Z").direction = 'NEG'
-        col.operator("cursor.flip_axis", text="Flip X").axis = 'X'
-        col.operator("cursor.flip_axis", text="Flip Y").axis = 'Y'
-        col.operator("cursor.flip_axis", text="Flip Z").axis = 'Z'
-        col.operator("cursor.copy_from_object", icon='COPYDOWN')
-        col.operator("cursor.apply_to_object", icon='CHECKMARK')
-        col.operator("cursor.align_to_view", icon='VIEW_ORTHO', text="Align to View")
-        col.operator("cursor.align_to_surface", icon='UV_FACESEL', text="Align to Surface")
-        col.operator("cursor.set_preset_orientation", icon='ORIENTATION_CURSOR', text="Set Preset Orientation")
-        col.operator("cursor.set_to_selection_center", icon='PIVOT_CURSOR', text="Cursor to Selection Center")
-        col.operator("cursor.set_to_view_center", icon='PIVOT_CURSOR', text="Cursor to View Center")
-        col.operator("object.create_transform_orientation", icon='ORIENTATION_GLOBAL', text="Create Transform Orientation")
+        draw_rotate_rows(col, "cursor.rotate_axis")
+        draw_operator_buttons(col, _PANEL_CURSOR_BUTTONS)
 
         # Rotation step
         box = layout.box()
@@ -905,28 +1109,10 @@ class VIEW3D_PT_cursor_align(Panel):
         # Object alignment tools
         box = layout.box()
         box.label(text="Object Alignment")
-        row = box.row(align=True)
-        row.operator("object.cursor_to_selected", icon='PIVOT_CURSOR', text="Cursor to Sel")
-        row.operator("object.selected_to_cursor", icon='PIVOT_CURSOR', text="Sel to Cursor")
-        row = box.row(align=True)
-        row.operator("object.origin_to_cursor", text="Origin to Cursor", icon='PIVOT_CURSOR')
-        row.operator("object.copy_cursor_location", text="Copy Cursor Loc", icon='COPYDOWN')
-        row.operator("object.reset_orientation", text="Reset Rot", icon='OBJECT_ORIGIN')
-        row = box.row(align=True)
-        row.operator("object.rotate_axis_step", text="+X").axis = 'X'
-        row.operator("object.rotate_axis_step", text="-X").axis = 'X'
-        row.operator("object.rotate_axis_step", text="-X").direction = 'NEG'
-        row = box.row(align=True)
-        row.operator("object.rotate_axis_step", text="+Y").axis = 'Y'
-        row.operator("object.rotate_axis_step", text="-Y").axis = 'Y'
-        row.operator("object.rotate_axis_step", text="-Y").direction = 'NEG'
-        row = box.row(align=True)
-        row.operator("object.rotate_axis_step", text="+Z").axis = 'Z'
-        row.operator("object.rotate_axis_step", text="-Z").axis = 'Z'
-        row.operator("object.rotate_axis_step", text="-Z").direction = 'NEG'
-        box.operator("object.align_to_cursor", text="Align to Cursor", icon='PIVOT_CURSOR')
-        box.operator("object.align_objects_to_each_other", text="Align to Active", icon='CONSTRAINT')
-        box.operator("object.distribute_along_cursor", text="Distribute Along Cursor", icon='ARROW_LEFTRIGHT')
+        draw_operator_buttons(box.row(align=True), _PANEL_SNAP_ROW)
+        draw_operator_buttons(box.row(align=True), _PANEL_ORIGIN_ROW)
+        draw_rotate_rows(box, "object.rotate_axis_step")
+        draw_operator_buttons(box, _PANEL_OBJECT_BUTTONS)
 
 
 # -----------------------------------------------------------------------------
@@ -944,64 +1130,17 @@ def draw_snap_menu(self, context):
     
     layout.separator()
     layout.label(text="Cursor & Origin Alignment", icon='ORIENTATION_CURSOR')
-    
-    # Cursor orientation tools - integrate with existing "to" pattern
-    layout.operator("cursor.reset_orientation", text="Cursor to World Orientation", icon='LOOP_BACK')
-    layout.operator("cursor.align_to_view", text="Cursor to View Orientation", icon='VIEW_ORTHO')
-    layout.operator("cursor.align_to_surface", text="Cursor to Surface Normal", icon='UV_FACESEL')
-    layout.operator("cursor.set_preset_orientation", text="Cursor to Preset", icon='ORIENTATION_CURSOR')
-    
-    # Cursor positioning tools - following the "to" naming convention
-    layout.operator("cursor.set_to_selection_center", text="Cursor to Selection Center", icon='PIVOT_CURSOR')
-    layout.operator("cursor.set_to_view_center", text="Cursor to View Center", icon='PIVOT_CURSOR')
-    
-    # Object alignment tools - integrate with existing object tools
-    layout.operator("object.origin_to_cursor", text="Origin to Cursor", icon='PIVOT_CURSOR')
-    layout.operator("object.copy_cursor_location", text="Object to Cursor Location", icon='COPYDOWN')
-    
-    # Advanced alignment tools
-    op = layout.operator("object.align_to_cursor", text="Objects to Cursor Orientation", icon='PIVOT_CURSOR')
-    op.move_objects = True
-    op.use_rotation = True
-    layout.operator("object.align_objects_to_each_other", text="Objects to Active Orientation", icon='CONSTRAINT')
+    draw_operator_buttons(layout, _SNAP_MENU_ALIGN_BUTTONS)
     
     # Rotation and transformation tools
     layout.separator()
     layout.label(text="Rotation & Transform", icon='DRIVER_ROTATIONAL_DIFFERENCE')
-    
-    # Quick rotation tools
-    row = layout.row(align=True)
-    op = row.operator("cursor.rotate_axis", text="+X")
-    op.axis = 'X'
-    op.direction = 'POS'
-    op = row.operator("cursor.rotate_axis", text="-X")
-    op.axis = 'X'
-    op.direction = 'NEG'
-    
-    row = layout.row(align=True)
-    op = row.operator("cursor.rotate_axis", text="+Y")
-    op.axis = 'Y'
-    op.direction = 'POS'
-    op = row.operator("cursor.rotate_axis", text="-Y")
-    op.axis = 'Y'
-    op.direction = 'NEG'
-    
-    row = layout.row(align=True)
-    op = row.operator("cursor.rotate_axis", text="+Z")
-    op.axis = 'Z'
-    op.direction = 'POS'
-    op = row.operator("cursor.rotate_axis", text="-Z")
-    op.axis = 'Z'
-    op.direction = 'NEG'
+    draw_rotate_rows(layout, "cursor.rotate_axis")
     
     # Utility tools
     layout.separator()
     layout.label(text="Utilities", icon='TOOL_SETTINGS')
-    
-    layout.operator("cursor.copy_from_object", text="Cursor to Object Rotation", icon='COPYDOWN')
-    layout.operator("cursor.apply_to_object", text="Apply Cursor to Objects", icon='CHECKMARK')
-    layout.operator("object.create_transform_orientation", text="Create Transform Orientation", icon='ORIENTATION_GLOBAL')
-    layout.operator("object.distribute_along_cursor", text="Distribute Along Cursor", icon='ARROW_LEFTRIGHT')
+    draw_operator_buttons(layout, _SNAP_MENU_UTILITY_BUTTONS)
 
 
 # -----------------------------------------------------------------------------
@@ -1016,33 +1155,11 @@ class VIEW3D_MT_cursor_origin_wheel(Menu):
     def draw(self, context):
         layout = self.layout
         pie = layout.menu_pie()
-        # Top (8 o'clock position) – Cursor to Selected
-        pie.operator("object.cursor_to_selected", text="Cursor to Selected", icon='PIVOT_CURSOR')
-        # Right – Selected to Cursor (no offset)
-        pie.operator("object.selected_to_cursor", text="Selected to Cursor", icon='PIVOT_CURSOR').use_offset = False
-        # Bottom – Origin to Cursor
-        pie.operator("object.origin_to_cursor", text="Origin to Cursor", icon='OBJECT_ORIGIN')
-        # Left – Align to Cursor (with rotation)
-        op = pie.operator("object.align_to_cursor", text="Align to Cursor", icon='PIVOT_CURSOR')
-        op.move_objects = True
-        op.use_rotation = True
-        # Upper left – Reset Cursor
-        pie.operator("cursor.reset_orientation", text="Reset Cursor", icon='LOOP_BACK')
-        # Upper right – Reset Objects
-        pie.operator("object.reset_orientation", text="Reset Objects", icon='OBJECT_ORIGIN')
-        # Lower right – Rotate Cursor +Z
-        op = pie.operator("cursor.rotate_axis", text="Rotate Cursor +Z", icon='DRIVER_ROTATIONAL_DIFFERENCE')
-        op.axis = 'Z'
-        op.direction = 'POS'
-        # Lower left – Rotate Objects +Z
-        op = pie.operator("object.rotate_axis_step", text="Rotate Objects +Z", icon='DRIVER_ROTATIONAL_DIFFERENCE')
-        op.axis = 'Z'
-        op.direction = 'POS'
+        draw_operator_buttons(pie, _PIE_WHEEL_BUTTONS)
         
         # Additional cursor tools in center - only show if Machine Tools is not available
         if not is_machine_tools_available():
-            pie.operator("cursor.align_to_view", text="Align to View", icon='VIEW_ORTHO')
-            pie.operator("cursor.align_to_surface", text="Align to Surface", icon='UV_FACESEL')
+            draw_operator_buttons(pie, _PIE_WHEEL_STANDALONE_BUTTONS)
 
 
 # -----------------------------------------------------------------------------
@@ -1060,51 +1177,22 @@ class VIEW3D_MT_cursor_align_machine_tools(Menu):
         # Cursor orientation tools
         layout.label(text="Cursor Orientation", icon='ORIENTATION_CURSOR')
         layout.separator()
-        
-        layout.operator("cursor.reset_orientation", icon='LOOP_BACK')
-        layout.operator("cursor.align_to_view", icon='VIEW_ORTHO')
-        layout.operator("cursor.align_to_surface", icon='UV_FACESEL')
-        layout.operator("cursor.set_preset_orientation", icon='ORIENTATION_CURSOR')
+        draw_operator_buttons(layout, _MT_MENU_ORIENTATION_BUTTONS)
         
         layout.separator()
         
         # Cursor positioning
         layout.label(text="Cursor Position", icon='PIVOT_CURSOR')
         layout.separator()
-        
-        layout.operator("cursor.set_to_selection_center", icon='PIVOT_CURSOR')
-        layout.operator("cursor.set_to_view_center", icon='PIVOT_CURSOR')
+        draw_operator_buttons(layout, _MT_MENU_POSITION_BUTTONS)
         
         layout.separator()
         
         # Cursor rotation tools
         props = context.scene.cursor_align_props
-        layout.label(text=f"Rotate ({props.rotation_step}°)", icon='DRIVER_ROTATIONAL_DIFFERENCE')
+        layout.label(text=f"Rotate ({props.rotation_step}°)", icon='DRIVER_ROTATIONAL_DIFFERENCE', translate=False)
         layout.separator()
-        
-        row = layout.row(align=True)
-        op = row.operator("cursor.rotate_axis", text="+X")
-        op.axis = 'X'
-        op.direction = 'POS'
-        op = row.operator("cursor.rotate_axis", text="-X")
-        op.axis = 'X'
-        op.direction = 'NEG'
-        
-        row = layout.row(align=True)
-        op = row.operator("cursor.rotate_axis", text="+Y")
-        op.axis = 'Y'
-        op.direction = 'POS'
-        op = row.operator("cursor.rotate_axis", text="-Y")
-        op.axis = 'Y'
-        op.direction = 'NEG'
-        
-        row = layout.row(align=True)
-        op = row.operator("cursor.rotate_axis", text="+Z")
-        op.axis = 'Z'
-        op.direction = 'POS'
-        op = row.operator("cursor.rotate_axis", text="-Z")
-        op.axis = 'Z'
-        op.direction = 'NEG'
+        draw_rotate_rows(layout, "cursor.rotate_axis")
 
 
 # -----------------------------------------------------------------------------
@@ -1118,7 +1206,9 @@ class CURSOR_OT_machine_tools_menu(Operator):
     bl_options = {'REGISTER'}
 
     def execute(self, context):
-        bpy.ops.wm.call_menu(name="VIEW3D_MT_cursor_align_machine_tools")
+        # Draw the menu straight into a popup rather than dispatching wm.call_menu
+        menu = VIEW3D_MT_cursor_align_machine_tools
+        context.window_manager.popup_menu(menu.draw, title=menu.bl_label, icon='ORIENTATION_CURSOR')
         return {'FINISHED'}
 
 
@@ -1133,12 +1223,15 @@ class CursorAlignAddonPreferences(AddonPreferences):
     def draw(self, context):
         layout = self.layout
         
+        # Add-ons are toggled from Preferences, so always show the live state here
+        _invalidate_mt_cache()
+        
         # Get scene properties for display
         try:
             props = context.scene.cursor_align_props
         except (AttributeError, KeyError):
             # Show message if properties not available
-            layout.label(text="Properties not available. Please restart Blender.")
+            layout.label(text="Properties not available. Please restart Blender.", translate=False)
             return
         
         # General settings
@@ -1157,27 +1250,27 @@ class CursorAlignAddonPreferences(AddonPreferences):
         if props.use_pie_menu:
             box.prop(props, "pie_menu_key", text="Pie Menu Hotkey")
             if props.pie_menu_key == 'SHIFT':
-                box.label(text="Note: This will override the default Shift+S snap menu", icon='INFO')
+                box.label(text="Note: This will override the default Shift+S snap menu", icon='INFO', translate=False)
         
         # Machine Tools integration info
         box = layout.box()
         box.label(text="Machine Tools Integration")
         if is_machine_tools_available():
-            box.label(text="✓ Machine Tools detected", icon='CHECKMARK')
-            box.label(text="• Snap menu integration disabled (Machine Tools handles this)")
-            box.label(text="• Access tools via the sidebar panel or add to Quick Favorites")
-            box.label(text="• Consider adding 'cursor.machine_tools_menu' to Quick Favorites")
+            box.label(text="✓ Machine Tools detected", icon='CHECKMARK', translate=False)
+            box.label(text="• Snap menu integration disabled (Machine Tools handles this)", translate=False)
+            box.label(text="• Access tools via the sidebar panel or add to Quick Favorites", translate=False)
+            box.label(text="• Consider adding 'cursor.machine_tools_menu' to Quick Favorites", translate=False)
         else:
-            box.label(text="• Machine Tools not detected", icon='QUESTION')
-            box.label(text="• Full snap menu integration available")
+            box.label(text="• Machine Tools not detected", icon='QUESTION', translate=False)
+            box.label(text="• Full snap menu integration available", translate=False)
         
         # Information
         box = layout.box()
         box.label(text="Information")
-        box.label(text="• The add-on adds a 'Cursor Align' tab to the 3D View sidebar")
-        box.label(text="• Use the panel to control cursor rotation and align objects")
-        box.label(text="• Enable snap menu integration for quick access via Shift+S")
-        box.label(text="• The pie menu provides radial access to common operations")
+        box.label(text="• The add-on adds a 'Cursor Align' tab to the 3D View sidebar", translate=False)
+        box.label(text="• Use the panel to control cursor rotation and align objects", translate=False)
+        box.label(text="• Enable snap menu integration for quick access via Shift+S", translate=False)
+        box.label(text="• The pie menu provides radial access to common operations", translate=False)
 
 
 # -----------------------------------------------------------------------------
@@ -1213,9 +1306,18 @@ classes = (
     CursorAlignAddonPreferences,
 )
 
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
 # Keymap handles stored here for unregister
 addon_keymaps = []
 
+# Pie hotkey modifier to keymap_items.new() keyword arguments
+_MOD_KWARGS = {
+    'SHIFT': {'shift': True},
+    'CTRL': {'ctrl': True},
+    'ALT': {'alt': True},
+}
+
 
 def register_keymap_pie():
     wm = bpy.context.window_manager
@@ -1232,26 +1334,32 @@ def register_keymap_pie():
         key_modifier = 'ALT'
     
     # Determine keymap hotkey based on modifier
+    kwargs = _MOD_KWARGS.get(key_modifier)
+    if kwargs is None:
+        # No automatic binding
+        return
     keymap = kc.keymaps.new(name='3D View', space_type='VIEW_3D')
     
     # Map S with chosen modifier; use call_menu_pie
-    if key_modifier == 'SHIFT':
-        keymap_item = keymap.keymap_items.new('wm.call_menu_pie', type='S', value='PRESS', shift=True)
-    elif key_modifier == 'CTRL':
-        keymap_item = keymap.keymap_items.new('wm.call_menu_pie', type='S', value='PRESS', ctrl=True)
-    elif key_modifier == 'ALT':
-        keymap_item = keymap.keymap_items.new('wm.call_menu_pie', type='S', value='PRESS', alt=True)
-    else:
-        # No automatic binding
-        return
+    keymap_item = keymap.keymap_items.new('wm.call_menu_pie', type='S', value='PRESS', **kwargs)
     
     keymap_item.properties.name = VIEW3D_MT_cursor_origin_wheel.bl_idname
     addon_keymaps.append((keymap, keymap_item))
 
 
 def unregister_keymap_pie():
+    # Group items per keymap so each keymap's item collection is looked up once
+    groups = defaultdict(list)
     for km, kmi in addon_keymaps:
-        km.keymap_items.remove(kmi)
+        groups[km].append(kmi)
+    for km, items in groups.items():
+        keymap_items = km.keymap_items
+        for kmi in items:
+            try:
+                keymap_items.remove(kmi)
+            except (ReferenceError, RuntimeError):
+                # Already removed by Blender (e.g. during an add-on reload)
+                pass
     addon_keymaps.clear()
 
 
@@ -1266,14 +1374,12 @@ def unregister_menu_draw():
         pass
 
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    
-    # Register property group and assign to scene
-    bpy.types.Scene.cursor_align_props = bpy.props.PointerProperty(type=CursorAlignProperties)
-    
-    # Check for Machine Tools integration
+def _deferred_integrate():
+    """Timer callback that hooks up menus and keymaps after startup settles.
+
+    Running this outside ``register()`` keeps the add-on scan off the
+    startup path and lets MACHIN3tools finish registering first.
+    """
     machine_tools_available = is_machine_tools_available()
     
     if machine_tools_available:
@@ -1297,20 +1403,40 @@ def register():
         print("Cursor & Origin Alignment: Machine Tools detected - snap menu integration disabled")
     else:
         print("Cursor & Origin Alignment: Standalone mode - full functionality enabled")
+    return None  # run only once
+
+
+def register():
+    register_classes()
+    
+    # Register property group and assign to scene
+    bpy.types.Scene.cursor_align_props = bpy.props.PointerProperty(type=CursorAlignProperties)
+    
+    # Machine Tools detection and menu integration run from a one-shot timer
+    _invalidate_mt_cache()
+    bpy.app.handlers.load_post.append(_invalidate_mt_cache_on_load)
+    # persistent=True so a .blend file loaded at startup doesn't drop the timer
+    bpy.app.timers.register(_deferred_integrate, first_interval=0.0, persistent=True)
 
 
 def unregister():
+    # Cancel the deferred integration if it has not run yet
+    if bpy.app.timers.is_registered(_deferred_integrate):
+        bpy.app.timers.unregister(_deferred_integrate)
+    
     # Remove menu items and keymaps
     unregister_menu_draw()
     unregister_keymap_pie()
     
     # Remove Machine Tools integration if it was added
     remove_machine_tools_integration()
+    if _invalidate_mt_cache_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_invalidate_mt_cache_on_load)
+    _invalidate_mt_cache()
     
     # Delete property
     del bpy.types.Scene.cursor_align_props
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
 
 
 if __name__ == "__main__":